@@ -89,7 +89,11 @@ DEFAULT_MAX_VARIABLE_LENGTH: int = 100
 
 def snooper_to_methods() -> Callable[..., Any]:
     def inner(cls: type[T]) -> type[T]:
-        if not pysnooper:
+        # When tracing is disabled every wrapped call would still pay a
+        # Python-level wrapper frame just to find tracing turned off, so the
+        # class is left untouched. Parser modules are imported lazily, after
+        # `enable_debug_message` has had a chance to run.
+        if not pysnooper or pysnooper.tracer.DISABLED:
             return cls
         import inspect  # noqa: PLC0415
 
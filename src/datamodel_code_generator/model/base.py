@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import os
 import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from copy import deepcopy
 from functools import cached_property, lru_cache
 from pathlib import Path
+from re import Pattern
 from typing import TYPE_CHECKING, Any, ClassVar, Optional, TypeVar
 from warnings import warn
 
+import jinja2
 from jinja2 import Environment, FileSystemLoader, Template
 from pydantic import Field
 
@@ -37,6 +40,9 @@ TEMPLATE_DIR: Path = Path(__file__).parents[0] / "template"
 
 ALL_MODEL: str = "#all#"
 
+_MODULE_NAME_SANITIZE_PATTERN: Pattern[str] = re.compile(r"[^0-9a-zA-Z_]")
+_MODULE_NAME_SANITIZE_WITH_DOT_PATTERN: Pattern[str] = re.compile(r"[^0-9a-zA-Z_.]")
+
 ConstraintsBaseT = TypeVar("ConstraintsBaseT", bound="ConstraintsBase")
 
 
@@ -142,10 +148,13 @@ class DataModelFieldBase(_BaseModel):
 
     @property
     def imports(self) -> tuple[Import, ...]:
-        type_hint = self.type_hint
-        has_union = not self.data_type.use_union_operator and UNION_PREFIX in type_hint
+        # `type_hint` is non-trivial to compute; short-circuit on the cheap flag
+        # so it is only evaluated when the union prefix can actually appear.
+        has_union = not self.data_type.use_union_operator and UNION_PREFIX in self.type_hint
         imports: list[tuple[Import] | Iterator[Import]] = [
-            iter(i for i in self.data_type.all_imports if not (not has_union and i == IMPORT_UNION))
+            self.data_type.all_imports
+            if has_union
+            else iter(i for i in self.data_type.all_imports if i != IMPORT_UNION)
         ]
 
         if self.fall_back_to_nullable:
@@ -197,34 +206,66 @@ class DataModelFieldBase(_BaseModel):
         return True
 
 
+JINJA_BYTECODE_CACHE_DIR_ENV_NAME: str = "DATAMODEL_CODE_GENERATOR_JINJA_BYTECODE_CACHE_DIR"
+
+
+@lru_cache
+def _get_bytecode_cache() -> jinja2.BytecodeCache | None:
+    # Opt-in persistent cache of compiled template bytecode, keyed by the
+    # jinja2 version so upgrades never pick up incompatible entries.
+    # Stale sources are detected by jinja2 itself via source checksums.
+    cache_dir = os.environ.get(JINJA_BYTECODE_CACHE_DIR_ENV_NAME)
+    if not cache_dir:
+        return None
+    cache_path = Path(cache_dir) / f"jinja2-{jinja2.__version__}"
+    cache_path.mkdir(parents=True, exist_ok=True)
+    return jinja2.FileSystemBytecodeCache(str(cache_path))
+
+
+@lru_cache
+def get_environment(template_dir: Path) -> Environment:
+    # Templates are static for the lifetime of the process; disabling
+    # auto-reload skips a stat call on every template lookup.
+    return Environment(  # noqa: S701
+        loader=FileSystemLoader(str(template_dir)),
+        auto_reload=False,
+        bytecode_cache=_get_bytecode_cache(),
+    )
+
+
 @lru_cache
 def get_template(template_file_path: Path) -> Template:
-    loader = FileSystemLoader(str(TEMPLATE_DIR / template_file_path.parent))
-    environment: Environment = Environment(loader=loader)  # noqa: S701
+    environment: Environment = get_environment(TEMPLATE_DIR / template_file_path.parent)
     return environment.get_template(template_file_path.name)
 
 
 def sanitize_module_name(name: str, *, treat_dot_as_module: bool) -> str:
-    pattern = r"[^0-9a-zA-Z_.]" if treat_dot_as_module else r"[^0-9a-zA-Z_]"
-    sanitized = re.sub(pattern, "_", name)
+    pattern = _MODULE_NAME_SANITIZE_WITH_DOT_PATTERN if treat_dot_as_module else _MODULE_NAME_SANITIZE_PATTERN
+    sanitized = pattern.sub("_", name)
     if sanitized and sanitized[0].isdigit():
         sanitized = f"_{sanitized}"
     return sanitized
 
 
-def get_module_path(name: str, file_path: Path | None, *, treat_dot_as_module: bool) -> list[str]:
+@lru_cache
+def _get_module_path(name: str, file_path: Path | None, *, treat_dot_as_module: bool) -> tuple[str, ...]:
     if file_path:
         sanitized_stem = sanitize_module_name(file_path.stem, treat_dot_as_module=treat_dot_as_module)
-        return [
+        return (
             *file_path.parts[:-1],
             sanitized_stem,
             *name.split(".")[:-1],
-        ]
-    return name.split(".")[:-1]
+        )
+    return tuple(name.split(".")[:-1])
+
+
+def get_module_path(name: str, file_path: Path | None, *, treat_dot_as_module: bool) -> list[str]:
+    return list(_get_module_path(name, file_path, treat_dot_as_module=treat_dot_as_module))
 
 
+@lru_cache
 def get_module_name(name: str, file_path: Path | None, *, treat_dot_as_module: bool) -> str:
-    return ".".join(get_module_path(name, file_path, treat_dot_as_module=treat_dot_as_module))
+    return ".".join(_get_module_path(name, file_path, treat_dot_as_module=treat_dot_as_module))
 
 
 class TemplateBase(ABC):
@@ -251,6 +292,14 @@ class TemplateBase(ABC):
 class BaseClassDataType(DataType): ...
 
 
+@lru_cache
+def _get_base_class_data_type(base_class: str) -> BaseClassDataType:
+    # Import-based base classes carry no reference and are never mutated after
+    # construction, so one instance per base-class path can be shared by every
+    # model using it.
+    return BaseClassDataType.from_import(Import.from_full_path(base_class))
+
+
 UNDEFINED: Any = object()
 
 
@@ -286,7 +335,7 @@ class DataModel(TemplateBase, Nullable, ABC):
 
         self._custom_template_dir: Path | None = custom_template_dir
         self.decorators: list[str] = decorators or []
-        self._additional_imports: list[Import] = []
+        self._additional_imports: list[Import] = list(self.DEFAULT_IMPORTS)
         self.custom_base_class = custom_base_class
         if base_classes:
             self.base_classes: list[BaseClassDataType] = [BaseClassDataType(reference=b) for b in base_classes]
@@ -330,7 +379,6 @@ class DataModel(TemplateBase, Nullable, ABC):
         for field in self.fields:
             field.parent = self
 
-        self._additional_imports.extend(self.DEFAULT_IMPORTS)
         self.default: Any = default
         self._nullable: bool = nullable
         self._treat_dot_as_module: bool = treat_dot_as_module
@@ -353,8 +401,9 @@ class DataModel(TemplateBase, Nullable, ABC):
             self.base_classes = []
             return
         base_class_import = Import.from_full_path(base_class)
-        self._additional_imports.append(base_class_import)
-        self.base_classes = [BaseClassDataType.from_import(base_class_import)]
+        if base_class_import not in self._additional_imports:
+            self._additional_imports.append(base_class_import)
+        self.base_classes = [_get_base_class_data_type(base_class)]
 
     @cached_property
     def template_file_path(self) -> Path:
@@ -367,6 +416,10 @@ class DataModel(TemplateBase, Nullable, ABC):
 
     @property
     def imports(self) -> tuple[Import, ...]:
+        # Not cached on purpose: the parser diffs this property before and
+        # after replacing references, so it has to reflect current state.
+        if not self.fields:
+            return tuple(self._additional_imports)
         return chain_as_tuple(
             (i for f in self.fields for i in f.imports),
             self._additional_imports,
@@ -107,10 +107,15 @@ class Enum(DataModel):
 
     @property
     def imports(self) -> tuple[Import, ...]:
-        return tuple(i for i in super().imports if i != IMPORT_ANY)
+        base_imports = super().imports
+        if IMPORT_ANY not in base_imports:
+            return base_imports
+        return tuple(i for i in base_imports if i != IMPORT_ANY)
 
 
 class Member:
+    __slots__ = ("alias", "enum", "field")
+
     def __init__(self, enum: Enum, field: DataModelFieldBase) -> None:
         self.enum: Enum = enum
         self.field: DataModelFieldBase = field
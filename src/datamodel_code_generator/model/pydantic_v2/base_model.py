@@ -27,6 +27,9 @@ if TYPE_CHECKING:
     from datamodel_code_generator.reference import Reference
 
 
+_LOOKAROUND_PATTERN: re.Pattern[str] = re.compile(r"\(\?<?[=!]")
+
+
 class UnionMode(Enum):
     smart = "smart"
     left_to_right = "left_to_right"
@@ -218,7 +221,7 @@ class BaseModel(BaseModelBase):
             pattern = (isinstance(field.constraints, Constraints) and field.constraints.pattern) or (
                 field.data_type.kwargs or {}
             ).get("pattern")
-            if pattern and re.search(r"\(\?<?[=!]", pattern):
+            if pattern and _LOOKAROUND_PATTERN.search(pattern):
                 config_parameters["regex_engine"] = '"python-re"'
                 break
 
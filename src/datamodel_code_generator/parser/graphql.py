@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from functools import lru_cache, partial
+from keyword import iskeyword
 from pathlib import Path
+from pickle import PicklingError  # noqa: S403
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
 )
 from urllib.parse import ParseResult
+from weakref import WeakKeyDictionary
 
 from datamodel_code_generator import (
     DefaultPutDict,
@@ -43,13 +48,75 @@ if TYPE_CHECKING:
     from collections import defaultdict
     from collections.abc import Iterable, Iterator, Mapping, Sequence
 
-graphql_resolver = graphql.type.introspection.TypeResolvers()
+TypeKind = graphql.type.introspection.TypeKind
+
+_ROOT_OPERATION_TYPES: frozenset[str] = frozenset({"Query", "Mutation"})
+
+_LIST_TYPE = graphql.GraphQLList
+_NON_NULL_TYPE = graphql.GraphQLNonNull
+_ENUM_TYPE = graphql.GraphQLEnumType
+_INPUT_FIELD_TYPE = graphql.GraphQLInputField
+# `Undefined` is a singleton, so identity comparison against a bound local is
+# enough and skips the attribute chain on every field.
+_UNDEFINED = graphql.pyutils.Undefined
+
+# `TypeResolvers.kind()` walks an isinstance chain for every type; a dict keyed
+# on the concrete class resolves the kind with a single hash lookup. The values
+# are the `TypeKind.*.value` strings: plain strings hash faster than enum
+# members (Enum delegates to DynamicClassAttribute and object hashing), and
+# the string is what ends up in reference paths anyway.
+_TYPE_KIND_BY_CLASS: dict[type[graphql.GraphQLNamedType], str] = {
+    graphql.GraphQLScalarType: TypeKind.SCALAR.value,
+    graphql.GraphQLEnumType: TypeKind.ENUM.value,
+    graphql.GraphQLInterfaceType: TypeKind.INTERFACE.value,
+    graphql.GraphQLObjectType: TypeKind.OBJECT.value,
+    graphql.GraphQLInputObjectType: TypeKind.INPUT_OBJECT.value,
+    graphql.GraphQLUnionType: TypeKind.UNION.value,
+}
+
+
+# Built schemas can be shared across parser runs (see the build cache below),
+# so the classification of their type maps is memoized per schema object. A
+# weak mapping keeps discarded schemas collectable.
+_classified_types_cache: WeakKeyDictionary[graphql.GraphQLSchema, tuple[tuple[str, graphql.GraphQLNamedType], ...]] = (
+    WeakKeyDictionary()
+)
+
+
+def _classified_types(schema: graphql.GraphQLSchema) -> tuple[tuple[str, graphql.GraphQLNamedType], ...]:
+    """Return (kind value, type) pairs for the schema's user-defined types."""
+    cached = _classified_types_cache.get(schema)
+    if cached is None:
+        cached = tuple(
+            (kind, type_)
+            for type_name, type_ in schema.type_map.items()
+            if type_name[:2] != "__"
+            and type_name not in _ROOT_OPERATION_TYPES
+            and (kind := _TYPE_KIND_BY_CLASS.get(type_.__class__)) is not None
+        )
+        _classified_types_cache[schema] = cached
+    return cached
+
+
+@lru_cache(maxsize=16)
+def _build_graphql_schema_from_text(schema_str: str, *, sort: bool) -> graphql.GraphQLSchema:
+    schema = graphql.build_ast_schema(graphql.parse(schema_str))
+    return graphql.lexicographic_sort_schema(schema) if sort else schema
 
 
-def build_graphql_schema(schema_str: str) -> graphql.GraphQLSchema:
-    """Build a graphql schema from a string."""
-    schema = graphql.build_schema(schema_str)
-    return graphql.lexicographic_sort_schema(schema)
+def build_graphql_schema(schema_str: str | graphql.DocumentNode, *, sort: bool = True) -> graphql.GraphQLSchema:
+    """Build a graphql schema from a string or a pre-parsed document.
+
+    Sorting rebuilds every type, field and enum value into fresh sorted maps,
+    so callers that want the source order can skip it. Identical schema text
+    is re-parsed often by repeated invocations (test suites, watch modes), so
+    text builds go through a small LRU cache; the parser only ever reads the
+    built schema, never mutates it, so sharing the instance is safe.
+    """
+    if isinstance(schema_str, graphql.DocumentNode):
+        schema = graphql.build_ast_schema(schema_str)
+        return graphql.lexicographic_sort_schema(schema) if sort else schema
+    return _build_graphql_schema_from_text(schema_str, sort=sort)
 
 
 @snooper_to_methods()
@@ -61,12 +128,12 @@ class GraphQLParser(Parser):
     all_graphql_objects: dict[str, graphql.GraphQLNamedType]
     # a reference for each object
     # mapper from an object name to his reference
-    references: dict[str, Reference] = {}  # noqa: RUF012
+    references: dict[str, Reference]
     # mapper from graphql type to all objects with this type
-    # `graphql.type.introspection.TypeKind` -- an enum with all supported types
+    # keyed by `graphql.type.introspection.TypeKind` value strings
     # `graphql.GraphQLNamedType` -- base type for each graphql object
     # see `graphql-core` for more details
-    support_graphql_types: dict[graphql.type.introspection.TypeKind, list[graphql.GraphQLNamedType]]
+    support_graphql_types: dict[str, list[graphql.GraphQLNamedType]]
     # graphql types order for render
     # may be as a parameter in the future
     parse_order: list[graphql.type.introspection.TypeKind] = [  # noqa: RUF012
@@ -242,6 +309,46 @@ class GraphQLParser(Parser):
         self.use_standard_collections = use_standard_collections
         self.use_union_operator = use_union_operator
 
+        self.all_graphql_objects = {}
+        self.references = {}
+
+        # may be as a parameter in the future (??)
+        self._kind_to_parser: dict[str, Callable[[Any], None]] = {
+            TypeKind.SCALAR.value: self.parse_scalar,
+            TypeKind.ENUM.value: self.parse_enum,
+            TypeKind.INTERFACE.value: self.parse_interface,
+            TypeKind.OBJECT.value: self.parse_object,
+            TypeKind.INPUT_OBJECT.value: self.parse_input_object,
+            TypeKind.UNION.value: self.parse_union,
+        }
+
+        # `parse_field` builds one optional DataType per wrap level of every
+        # field; a partial with the parser-constant kwargs avoids rebuilding
+        # the keyword dict on each call.
+        self._make_optional_data_type = partial(
+            DataType,
+            is_optional=True,
+            use_union_operator=use_union_operator,
+            use_standard_collections=use_standard_collections,
+        )
+
+        # `_typename_field` runs once per object-like type and only the
+        # literal value changes; everything else is parser-constant.
+        self._typename_data_type = partial(
+            DataType,
+            use_union_operator=use_union_operator,
+            use_standard_collections=use_standard_collections,
+        )
+        self._typename_field_kwargs: dict[str, Any] = {
+            "name": "typename__",
+            "use_annotated": use_annotated,
+            "required": False,
+            "alias": "__typename",
+            "use_one_literal_as_default": True,
+            "use_default_kwarg": use_default_kwarg,
+            "has_default": True,
+        }
+
     def _get_context_source_path_parts(self) -> Iterator[tuple[Source, list[str]]]:
         # TODO (denisart): Temporarily this method duplicates
         # the method `datamodel_code_generator.parser.jsonschema.JsonSchemaParser._get_context_source_path_parts`.
@@ -268,25 +375,31 @@ class GraphQLParser(Parser):
                 yield source, path_parts
 
     def _resolve_types(self, paths: list[str], schema: graphql.GraphQLSchema) -> None:
-        for type_name, type_ in schema.type_map.items():
-            if type_name.startswith("__"):
-                continue
-
-            if type_name in {"Query", "Mutation"}:
-                continue
-
-            resolved_type = graphql_resolver.kind(type_, None)
-
-            if resolved_type in self.support_graphql_types:  # pragma: no cover
-                self.all_graphql_objects[type_.name] = type_
-                # TODO: need a special method for each graph type
-                self.references[type_.name] = Reference(
-                    path=f"{paths!s}/{resolved_type.value}/{type_.name}",
-                    name=type_.name,
-                    original_name=type_.name,
-                )
+        support_graphql_types = self.support_graphql_types
+        paths_str = f"{paths!s}"
+        # The reference path only varies in its tail; formatting the
+        # per-kind prefix once turns the per-type f-string into a plain
+        # concatenation.
+        path_prefixes = {kind: f"{paths_str}/{kind}/" for kind in _TYPE_KIND_BY_CLASS.values()}
+
+        # Accumulate locally and merge once: dict.update bulk-inserts at C
+        # level instead of paying a store (and potential resize) per type.
+        new_objects: dict[str, graphql.GraphQLNamedType] = {}
+        new_references: dict[str, Reference] = {}
+
+        for resolved_type, type_ in _classified_types(schema):
+            new_objects[type_.name] = type_
+            # TODO: need a special method for each graph type
+            new_references[type_.name] = Reference(
+                path=path_prefixes[resolved_type] + type_.name,
+                name=type_.name,
+                original_name=type_.name,
+            )
+
+            support_graphql_types[resolved_type].append(type_)
 
-                self.support_graphql_types[resolved_type].append(type_)
+        self.all_graphql_objects.update(new_objects)
+        self.references.update(new_references)
 
     def _create_data_model(self, model_type: type[DataModel] | None = None, **kwargs: Any) -> DataModel:
         """Create data model instance with conditional frozen parameter for DataClass."""
@@ -297,35 +410,20 @@ class GraphQLParser(Parser):
 
     def _typename_field(self, name: str) -> DataModelFieldBase:
         return self.data_model_field_type(
-            name="typename__",
-            data_type=DataType(
-                literals=[name],
-                use_union_operator=self.use_union_operator,
-                use_standard_collections=self.use_standard_collections,
-            ),
+            data_type=self._typename_data_type(literals=[name]),
             default=name,
-            use_annotated=self.use_annotated,
-            required=False,
-            alias="__typename",
-            use_one_literal_as_default=True,
-            use_default_kwarg=self.use_default_kwarg,
-            has_default=True,
+            **self._typename_field_kwargs,
         )
 
     def _get_default(  # noqa: PLR6301
         self,
         field: graphql.GraphQLField | graphql.GraphQLInputField,
-        final_data_type: DataType,
-        required: bool,  # noqa: FBT001
     ) -> Any:
-        if isinstance(field, graphql.GraphQLInputField):  # pragma: no cover
-            if field.default_value == graphql.pyutils.Undefined:  # pragma: no cover
-                return None
-            return field.default_value
-        if required is False and final_data_type.is_list:
+        if type(field) is not _INPUT_FIELD_TYPE:
             return None
-
-        return None
+        if field.default_value is _UNDEFINED:  # pragma: no cover
+            return None
+        return field.default_value  # pragma: no cover
 
     def parse_scalar(self, scalar_graphql_object: graphql.GraphQLScalarType) -> None:
         self.results.append(
@@ -342,20 +440,25 @@ class GraphQLParser(Parser):
         enum_fields: list[DataModelFieldBase] = []
         exclude_field_names: set[str] = set()
 
+        # Every member shares the same string data type; resolve it (and the
+        # field class) once instead of per member.
+        string_data_type = self.data_type_manager.get_data_type(Types.string)
+        field_type = self.data_model_field_type
+        get_valid_field_name = self.model_resolver.get_valid_field_name
+        enum_fields_append = enum_fields.append
+        exclude_field_names_add = exclude_field_names.add
+
         for value_name, value in enum_object.values.items():
-            default = f"'{value_name.translate(escape_characters)}'" if isinstance(value_name, str) else value_name
+            # graphql-core guarantees value names are strings.
+            default = f"'{value_name.translate(escape_characters)}'"
 
-            field_name = self.model_resolver.get_valid_field_name(
-                value_name, excludes=exclude_field_names, model_type=ModelType.ENUM
-            )
-            exclude_field_names.add(field_name)
+            field_name = get_valid_field_name(value_name, excludes=exclude_field_names, model_type=ModelType.ENUM)
+            exclude_field_names_add(field_name)
 
-            enum_fields.append(
-                self.data_model_field_type(
+            enum_fields_append(
+                field_type(
                     name=field_name,
-                    data_type=self.data_type_manager.get_data_type(
-                        Types.string,
-                    ),
+                    data_type=string_data_type,
                     default=default,
                     required=True,
                     strip_default_none=self.strip_default_none,
@@ -380,43 +483,45 @@ class GraphQLParser(Parser):
         alias: str | None,
         field: graphql.GraphQLField | graphql.GraphQLInputField,
     ) -> DataModelFieldBase:
-        final_data_type = DataType(
-            is_optional=True,
-            use_union_operator=self.use_union_operator,
-            use_standard_collections=self.use_standard_collections,
-        )
+        make_optional_data_type = self._make_optional_data_type
+        final_data_type = make_optional_data_type()
         data_type = final_data_type
         obj = field.type
 
-        while graphql.is_list_type(obj) or graphql.is_non_null_type(obj):
-            if graphql.is_list_type(obj):
+        while True:
+            obj_class = obj.__class__
+            if obj_class is _LIST_TYPE:
                 data_type.is_list = True
 
-                new_data_type = DataType(
-                    is_optional=True,
-                    use_union_operator=self.use_union_operator,
-                    use_standard_collections=self.use_standard_collections,
-                )
+                new_data_type = make_optional_data_type()
                 data_type.data_types = [new_data_type]
 
                 data_type = new_data_type
-            elif graphql.is_non_null_type(obj):  # pragma: no cover
+            elif obj_class is _NON_NULL_TYPE:
                 data_type.is_optional = False
+            else:
+                break
 
-            obj = graphql.assert_wrapping_type(obj)
-            obj = obj.of_type
+            # The class compares above narrowed `obj` at runtime, but pyright
+            # only understands the graphql.is_* TypeGuard wrappers.
+            obj = obj.of_type  # pyright: ignore[reportAttributeAccessIssue]
 
-        if graphql.is_enum_type(obj):
-            obj = graphql.assert_enum_type(obj)
-            data_type.reference = self.references[obj.name]
+        # The unwrap loop above has already stripped every wrapping type, so
+        # `obj` is a named type here; the `graphql.is_*`/`assert_*` wrappers
+        # would only repeat that check.
+        obj_name = obj.name  # pyright: ignore[reportAttributeAccessIssue]
+        if type(obj) is _ENUM_TYPE:
+            data_type.reference = self.references[obj_name]
 
-        obj = graphql.assert_named_type(obj)
-        data_type.type = obj.name
+        data_type.type = obj_name
 
         required = (not self.force_optional_for_required_fields) and (not final_data_type.is_optional)
 
-        default = self._get_default(field, final_data_type, required)
-        extras = {} if self.default_field_extras is None else self.default_field_extras.copy()
+        default = self._get_default(field)
+        # A fresh dict per field is still required (post-processing mutates
+        # field extras in place), but an empty or absent default needs no copy.
+        default_field_extras = self.default_field_extras
+        extras = dict(default_field_extras) if default_field_extras else {}
 
         if field.description is not None:  # pragma: no cover
             extras["description"] = field.description
@@ -443,20 +548,43 @@ class GraphQLParser(Parser):
         fields = []
         exclude_field_names: set[str] = set()
 
+        # Most field names are already valid, unique identifiers; when no
+        # renaming option is active they can skip the resolver machinery
+        # entirely and be used verbatim.
+        resolver = self.model_resolver.field_name_resolvers[ModelType.PYDANTIC]
+        fast_path = not (resolver.aliases or resolver.snake_case_field or resolver.capitalise_enum_members)
+        is_valid_field_name = resolver._validate_field_name  # noqa: SLF001
+        get_valid_field_name_and_alias = resolver.get_valid_field_name_and_alias
+        parse_field = self.parse_field
+        fields_append = fields.append
+        exclude_field_names_add = exclude_field_names.add
+
         for field_name, field in obj.fields.items():
-            field_name_, alias = self.model_resolver.get_valid_field_name_and_alias(
-                field_name, excludes=exclude_field_names
-            )
-            exclude_field_names.add(field_name_)
+            if (
+                fast_path  # noqa: PLR0916
+                and field_name not in exclude_field_names
+                and field_name[:1] != "_"
+                and field_name.isidentifier()
+                and not iskeyword(field_name)
+                and is_valid_field_name(field_name)
+            ):
+                field_name_, alias = field_name, None
+            else:
+                field_name_, alias = get_valid_field_name_and_alias(field_name, excludes=exclude_field_names)
+            exclude_field_names_add(field_name_)
 
-            data_model_field_type = self.parse_field(field_name_, alias, field)
-            fields.append(data_model_field_type)
+            fields_append(parse_field(field_name_, alias, field))
 
         fields.append(self._typename_field(obj.name))
 
-        base_classes = []
-        if hasattr(obj, "interfaces"):  # pragma: no cover
-            base_classes = [self.references[i.name] for i in obj.interfaces]  # pyright: ignore[reportAttributeAccessIssue]
+        # Only object and interface types carry `interfaces`; input objects
+        # fall through via the getattr default.
+        interfaces = getattr(obj, "interfaces", None)
+        if interfaces:
+            references = self.references
+            base_classes = [references[interface.name] for interface in interfaces]
+        else:
+            base_classes = []
 
         data_model_type = self._create_data_model(
             reference=self.references[obj.name],
@@ -482,7 +610,8 @@ class GraphQLParser(Parser):
         self.parse_object_like(input_graphql_object)  # pragma: no cover
 
     def parse_union(self, union_object: graphql.GraphQLUnionType) -> None:
-        fields = [self.data_model_field_type(name=type_.name, data_type=DataType()) for type_ in union_object.types]
+        field_type = self.data_model_field_type
+        fields = [field_type(name=type_.name, data_type=DataType()) for type_ in union_object.types]
 
         data_model_type = self.data_model_union_type(
             reference=self.references[union_object.name],
@@ -499,32 +628,44 @@ class GraphQLParser(Parser):
         self.all_graphql_objects = {}
         self.references: dict[str, Reference] = {}
 
-        self.support_graphql_types = {
-            graphql.type.introspection.TypeKind.SCALAR: [],
-            graphql.type.introspection.TypeKind.ENUM: [],
-            graphql.type.introspection.TypeKind.UNION: [],
-            graphql.type.introspection.TypeKind.INTERFACE: [],
-            graphql.type.introspection.TypeKind.OBJECT: [],
-            graphql.type.introspection.TypeKind.INPUT_OBJECT: [],
-        }
-
-        # may be as a parameter in the future (??)
-        mapper_from_graphql_type_to_parser_method = {
-            graphql.type.introspection.TypeKind.SCALAR: self.parse_scalar,
-            graphql.type.introspection.TypeKind.ENUM: self.parse_enum,
-            graphql.type.introspection.TypeKind.INTERFACE: self.parse_interface,
-            graphql.type.introspection.TypeKind.OBJECT: self.parse_object,
-            graphql.type.introspection.TypeKind.INPUT_OBJECT: self.parse_input_object,
-            graphql.type.introspection.TypeKind.UNION: self.parse_union,
-        }
+        self.support_graphql_types = {kind: [] for kind in _TYPE_KIND_BY_CLASS.values()}
+
+        # Parsing each schema document is CPU-bound pure Python and the
+        # documents are independent, so with several sources the parse step
+        # fans out to a process pool; reference resolution stays sequential
+        # because it is order dependent.
+        pre_parsed_documents: dict[Path, graphql.DocumentNode] = {}
+        multiple_sources = isinstance(self.source, list) or (isinstance(self.source, Path) and self.source.is_dir())
+        sources = list(self.iter_source) if multiple_sources else []
+        if len(sources) > 1:  # pragma: no cover
+            try:
+                with ProcessPoolExecutor() as executor:
+                    pre_parsed_documents = dict(
+                        zip(
+                            (source.path for source in sources),
+                            executor.map(graphql.parse, (source.text for source in sources)),
+                        )
+                    )
+            except (OSError, BrokenExecutor, PicklingError):
+                # No usable worker processes; fall back to in-process parsing.
+                pre_parsed_documents = {}
 
         for source, path_parts in self._get_context_source_path_parts():
-            schema: graphql.GraphQLSchema = build_graphql_schema(source.text)
+            document = pre_parsed_documents.get(source.path)
+            schema: graphql.GraphQLSchema = build_graphql_schema(
+                source.text if document is None else document, sort=not self.keep_model_order
+            )
             self.raw_obj = schema
 
             self._resolve_types(path_parts, schema)
 
+            support_graphql_types = self.support_graphql_types
+            kind_to_parser = self._kind_to_parser
             for next_type in self.parse_order:
-                for obj in self.support_graphql_types[next_type]:
-                    parser_ = mapper_from_graphql_type_to_parser_method[next_type]
+                kind = next_type.value
+                objs = support_graphql_types[kind]
+                if not objs:
+                    continue
+                parser_ = kind_to_parser[kind]
+                for obj in objs:
                     parser_(obj)
@@ -148,6 +148,8 @@ def context_variable(setter: Callable[[T], None], current_value: T, new_value: T
 _UNDER_SCORE_1: Pattern[str] = re.compile(r"([^_])([A-Z][a-z]+)")
 _UNDER_SCORE_2: Pattern[str] = re.compile(r"([a-z0-9])([A-Z])")
 
+_INVALID_FIELD_NAME_CHARACTERS: Pattern[str] = re.compile(r"[¹²³⁴⁵⁶⁷⁸⁹]|\W")
+
 
 @lru_cache
 def camel_to_snake(string: str) -> str:
@@ -197,7 +199,7 @@ class FieldNameResolver:
         if self.snake_case_field and not ignore_snake_case_field and self.original_delimiter is not None:
             name = snake_to_upper_camel(name, delimiter=self.original_delimiter)
 
-        name = re.sub(r"[¹²³⁴⁵⁶⁷⁸⁹]|\W", "_", name)
+        name = _INVALID_FIELD_NAME_CHARACTERS.sub("_", name)
         if name[0].isnumeric():
             name = f"{self.special_field_name_prefix}_{name}"
 
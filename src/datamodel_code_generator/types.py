@@ -91,6 +91,8 @@ class StrictTypes(Enum):
 
 
 class UnionIntFloat:
+    __slots__ = ("value",)
+
     def __init__(self, value: float) -> None:
         self.value: int | float = value
 
@@ -344,10 +346,7 @@ class DataType(_BaseModel):
 
     @property
     def unresolved_types(self) -> frozenset[str]:
-        return frozenset(
-            {t.reference.path for data_types in self.data_types for t in data_types.all_data_types if t.reference}
-            | ({self.reference.path} if self.reference else set())
-        )
+        return frozenset(t.reference.path for t in self.all_data_types if t.reference)
 
     def replace_reference(self, reference: Reference | None) -> None:
         if not self.reference:  # pragma: no cover
@@ -0,0 +1,154 @@
+# generated by datamodel-codegen:
+#   filename:  simple-star-wars.graphql
+#   timestamp: 2019-07-26T00:00:00+00:00
+
+from __future__ import annotations
+
+from typing import List, Literal, Optional, TypeAlias
+
+from pydantic import BaseModel, Field
+
+Boolean: TypeAlias = bool
+"""
+The `Boolean` scalar type represents `true` or `false`.
+"""
+
+
+class Film(BaseModel):
+    id: ID
+    title: String
+    episode_id: Int
+    opening_crawl: String
+    director: String
+    producer: Optional[String] = None
+    release_date: String
+    characters: List[Person]
+    characters_ids: List[ID]
+    planets: List[Planet]
+    planets_ids: List[ID]
+    starships: List[Starship]
+    starships_ids: List[ID]
+    vehicles: List[Vehicle]
+    vehicles_ids: List[ID]
+    species: List[Species]
+    species_ids: List[ID]
+    typename__: Optional[Literal['Film']] = Field('Film', alias='__typename')
+
+
+ID: TypeAlias = str
+"""
+The `ID` scalar type represents a unique identifier, often used to refetch an object or as key for a cache. The ID type appears in a JSON response as a String; however, it is not intended to be human-readable. When expected as an input type, any string (such as `"4"`) or integer (such as `4`) input value will be accepted as an ID.
+"""
+
+
+Int: TypeAlias = int
+"""
+The `Int` scalar type represents non-fractional signed whole numeric values. Int can represent values between -(2^31) and 2^31 - 1.
+"""
+
+
+class Person(BaseModel):
+    id: ID
+    name: String
+    height: Optional[Int] = None
+    mass: Optional[Int] = None
+    hair_color: Optional[String] = None
+    skin_color: Optional[String] = None
+    eye_color: Optional[String] = None
+    birth_year: Optional[String] = None
+    gender: Optional[String] = None
+    homeworld_id: Optional[ID] = None
+    homeworld: Optional[Planet] = None
+    species: List[Species]
+    species_ids: List[ID]
+    films: List[Film]
+    films_ids: List[ID]
+    starships: List[Starship]
+    starships_ids: List[ID]
+    vehicles: List[Vehicle]
+    vehicles_ids: List[ID]
+    typename__: Optional[Literal['Person']] = Field('Person', alias='__typename')
+
+
+class Planet(BaseModel):
+    id: ID
+    name: String
+    rotation_period: Optional[String] = None
+    orbital_period: Optional[String] = None
+    diameter: Optional[String] = None
+    climate: Optional[String] = None
+    gravity: Optional[String] = None
+    terrain: Optional[String] = None
+    surface_water: Optional[String] = None
+    population: Optional[String] = None
+    residents: List[Person]
+    residents_ids: List[ID]
+    films: List[Film]
+    films_ids: List[ID]
+    typename__: Optional[Literal['Planet']] = Field('Planet', alias='__typename')
+
+
+class Species(BaseModel):
+    id: ID
+    name: String
+    classification: Optional[String] = None
+    designation: Optional[String] = None
+    average_height: Optional[String] = None
+    skin_colors: Optional[String] = None
+    hair_colors: Optional[String] = None
+    eye_colors: Optional[String] = None
+    average_lifespan: Optional[String] = None
+    language: Optional[String] = None
+    people: List[Person]
+    people_ids: List[ID]
+    films: List[Film]
+    films_ids: List[ID]
+    typename__: Optional[Literal['Species']] = Field('Species', alias='__typename')
+
+
+class Starship(BaseModel):
+    id: ID
+    name: String
+    model: Optional[String] = None
+    manufacturer: Optional[String] = None
+    cost_in_credits: Optional[String] = None
+    length: Optional[String] = None
+    max_atmosphering_speed: Optional[String] = None
+    crew: Optional[String] = None
+    passengers: Optional[String] = None
+    cargo_capacity: Optional[String] = None
+    consumables: Optional[String] = None
+    hyperdrive_rating: Optional[String] = None
+    MGLT: Optional[String] = None
+    starship_class: Optional[String] = None
+    pilots: List[Person]
+    pilots_ids: List[ID]
+    films: List[Film]
+    films_ids: List[ID]
+    typename__: Optional[Literal['Starship']] = Field('Starship', alias='__typename')
+
+
+String: TypeAlias = str
+"""
+The `String` scalar type represents textual data, represented as UTF-8 character sequences. The String type is most often used by GraphQL to represent free-form human-readable text.
+"""
+
+
+class Vehicle(BaseModel):
+    id: ID
+    name: String
+    model: Optional[String] = None
+    manufacturer: Optional[String] = None
+    cost_in_credits: Optional[String] = None
+    length: Optional[String] = None
+    max_atmosphering_speed: Optional[String] = None
+    crew: Optional[String] = None
+    passengers: Optional[String] = None
+    cargo_capacity: Optional[String] = None
+    consumables: Optional[String] = None
+    vehicle_class: Optional[String] = None
+    pilots: List[Person]
+    pilots_ids: List[ID]
+    films: List[Film]
+    films_ids: List[ID]
+    typename__: Optional[Literal['Vehicle']] = Field('Vehicle', alias='__typename')
@@ -314,3 +314,23 @@ def test_main_graphql_extra_fields_allow(tmp_path: Path) -> None:
         output_file.read_text(encoding="utf-8")
         == (EXPECTED_GRAPHQL_PATH / "simple_star_wars_extra_fields_allow.py").read_text()
     )
+
+
+@freeze_time("2019-07-26")
+@pytest.mark.skipif(
+    black.__version__.split(".")[0] == "19",
+    reason="Installed black doesn't support the old style",
+)
+def test_main_graphql_keep_model_order(tmp_path: Path) -> None:
+    output_file: Path = tmp_path / "output.py"
+    return_code: Exit = main([
+        "--input",
+        str(GRAPHQL_DATA_PATH / "simple-star-wars.graphql"),
+        "--output",
+        str(output_file),
+        "--input-file-type",
+        "graphql",
+        "--keep-model-order",
+    ])
+    assert return_code == Exit.OK
+    assert output_file.read_text(encoding="utf-8") == (EXPECTED_GRAPHQL_PATH / "keep_model_order.py").read_text()
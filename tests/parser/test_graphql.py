@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
 from freezegun import freeze_time
 
 from datamodel_code_generator.__main__ import Exit, main
@@ -31,11 +32,12 @@ def test_graphql_field_enum(tmp_path: Path) -> None:
 
 
 @freeze_time("2019-07-26")
-def test_graphql_union_aliased_bug(tmp_path: Path) -> None:
+@pytest.mark.parametrize("schema_name", ["union-aliased-bug", "union-commented"])
+def test_graphql_union(schema_name: str, tmp_path: Path) -> None:
     output_file: Path = tmp_path / "output.py"
     return_code: Exit = main([
         "--input",
-        str(GRAPHQL_DATA_PATH / "union-aliased-bug.graphql"),
+        str(GRAPHQL_DATA_PATH / f"{schema_name}.graphql"),
         "--output",
         str(output_file),
         "--input-file-type",
@@ -43,26 +45,5 @@ def test_graphql_union_aliased_bug(tmp_path: Path) -> None:
     ])
     assert return_code == Exit.OK
     actual = output_file.read_text(encoding="utf-8").rstrip()
-    expected = (EXPECTED_GRAPHQL_PATH / "union-aliased-bug.py").read_text().rstrip()
-    if actual != expected:
-        pass
-    assert actual == expected
-
-
-@freeze_time("2019-07-26")
-def test_graphql_union_commented(tmp_path: Path) -> None:
-    output_file: Path = tmp_path / "output.py"
-    return_code: Exit = main([
-        "--input",
-        str(GRAPHQL_DATA_PATH / "union-commented.graphql"),
-        "--output",
-        str(output_file),
-        "--input-file-type",
-        "graphql",
-    ])
-    assert return_code == Exit.OK
-    actual = output_file.read_text(encoding="utf-8").rstrip()
-    expected = (EXPECTED_GRAPHQL_PATH / "union-commented.py").read_text().rstrip()
-    if actual != expected:
-        pass
+    expected = (EXPECTED_GRAPHQL_PATH / f"{schema_name}.py").read_text().rstrip()
     assert actual == expected